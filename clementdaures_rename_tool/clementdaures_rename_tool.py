@@ -1,34 +1,96 @@
+from collections import deque
+from contextlib import contextmanager
+from functools import partial
+
+import maya.api.OpenMaya as om
 import maya.cmds as cmds
 
-# Global list to keep track of renaming history
-renaming_history = []
+# Number of renames kept in the history
+HISTORY_LIMIT = 500
+
+# Global history of the most recent renames as parallel old/new name columns, oldest entries are dropped first
+renaming_history_old = deque(maxlen=HISTORY_LIMIT)
+renaming_history_new = deque(maxlen=HISTORY_LIMIT)
+
+# Last known value of every input field, kept up to date by the controls' change callbacks
+_ui_state = {
+    "base_name": "", "start_number": 1, "padding": 2,
+    "prefix": "", "suffix": "",
+    "search": "", "replace": "", "scope": 2,
+    "convention": "Rig",
+}
+
+# Control behind each _ui_state key, as (control command, control name, value flag)
+_UI_CONTROLS = {
+    "base_name": (cmds.textFieldGrp, 'renameTextField', 'text'),
+    "start_number": (cmds.intFieldGrp, 'startNumberField', 'value1'),
+    "padding": (cmds.intFieldGrp, 'paddingField', 'value1'),
+    "prefix": (cmds.textFieldGrp, 'prefixTextField', 'text'),
+    "suffix": (cmds.textFieldGrp, 'suffixTextField', 'text'),
+    "search": (cmds.textFieldGrp, 'searchTextField', 'text'),
+    "replace": (cmds.textFieldGrp, 'replaceTextField', 'text'),
+    "scope": (cmds.radioButtonGrp, 'searchReplaceOption', 'select'),
+    "convention": (cmds.optionMenuGrp, 'namingConventionMenu', 'value'),
+}
+
+# Labels of the quick prefix and suffix buttons
+QUICK_PREFIXES = ('Grp', 'Sk', 'Jnt','Bn', 'Ctrl', 'EFF', 'IKRP', 'IKSC', 'IKSPL', 'IKSPR', 'Loc', 'Geo', 'Proxy', 'Wire', 'ffdLat', 'RBN', 'CRV', 'BS', 'DRV', 'AUTO')
+QUICK_SUFFIXES = ('Lt', 'Rt', 'T', 'TOP', 'MID', 'LOW', 'CTR')
+
+# Prefix added by each automated naming convention
+_CONVENTION_PREFIX = {"Rig": "RIG_", "Animation": "ANIM_", "Geometry": "GEO_", "Controller": "CTRL_"}
+
+@contextmanager
+def _undo_chunk(name='dc_rename'):
+    """Group every command issued inside the block into a single undo step."""
+    cmds.undoInfo(openChunk=True, chunkName=name)
+    try:
+        yield
+    finally:
+        cmds.undoInfo(closeChunk=True)
 
 def clementdaures_rename_tool():
     """Main function to initialize and display the Rename Tool window."""
+    # Closing only hides the window, so a relaunch shows the existing controls instead of rebuilding them
     if cmds.window('dc_renameWindow', exists=True):
-        cmds.deleteUI('dc_renameWindow')
+        _push_ui_state()
+        cmds.showWindow('dc_renameWindow')
+        return
 
     # Create the main window
-    window = cmds.window('dc_renameWindow', title="DC Rename Tool", widthHeight=(400, 600), sizeable=True)
+    window = cmds.window('dc_renameWindow', title="DC Rename Tool", widthHeight=(400, 600), sizeable=True, retain=True)
+
+    # Shared settings for the repeated frames and text fields
+    if cmds.uiTemplate('dcRenameTemplate', exists=True):
+        cmds.deleteUI('dcRenameTemplate', uiTemplate=True)
+    cmds.uiTemplate('dcRenameTemplate')
+    cmds.frameLayout(defineTemplate='dcRenameTemplate', collapsable=True, width=380, marginHeight=5)
+    cmds.textFieldGrp(defineTemplate='dcRenameTemplate', columnAlign=(1, 'right'), columnWidth=[(1, 80), (2, 280)])
+    cmds.setUITemplate('dcRenameTemplate', pushTemplate=True)
 
     # Main layout
     main_layout = cmds.columnLayout(adjustableColumn=True, rowSpacing=10, columnAlign="center")
 
     # Rename and Number Section
-    cmds.frameLayout(label="Rename and Number", collapsable=True, width=380, marginHeight=5)
-    cmds.textFieldGrp('renameTextField', label="Rename:", columnAlign=(1, 'right'), columnWidth=[(1, 80), (2, 280)])
+    cmds.frameLayout(label="Rename and Number")
+    cmds.textFieldGrp('renameTextField', label="Rename:", text=_ui_state["base_name"],
+                      textChangedCommand=_stored("base_name"))
     cmds.rowColumnLayout(numberOfColumns=2, columnWidth=[(1, 180), (2, 180)])
-    cmds.intFieldGrp('startNumberField', label="Start Number:", value1=1, columnWidth=[(1, 90), (2, 90)])
-    cmds.intFieldGrp('paddingField', label="Padding:", value1=2, columnWidth=[(1, 90), (2, 90)])
+    cmds.intFieldGrp('startNumberField', label="Start Number:", value1=_ui_state["start_number"], columnWidth=[(1, 90), (2, 90)],
+                     changeCommand=_tracked("start_number"))
+    cmds.intFieldGrp('paddingField', label="Padding:", value1=_ui_state["padding"], columnWidth=[(1, 90), (2, 90)],
+                     changeCommand=_tracked("padding"))
     cmds.setParent('..')
     cmds.button(label="Rename and Number", height=30, command=lambda x: rename_and_number_objects())
 
     cmds.separator(height=20, style="in")
 
     # Prefix/Suffix Section
-    cmds.frameLayout(label="Prefix and Suffix", collapsable=True, width=380, marginHeight=5)
-    cmds.textFieldGrp('prefixTextField', label="Prefix:", columnAlign=(1, 'right'), columnWidth=[(1, 80), (2, 280)])
-    cmds.textFieldGrp('suffixTextField', label="Suffix:", columnAlign=(1, 'right'), columnWidth=[(1, 80), (2, 280)])
+    cmds.frameLayout(label="Prefix and Suffix")
+    cmds.textFieldGrp('prefixTextField', label="Prefix:", text=_ui_state["prefix"],
+                      textChangedCommand=_stored("prefix"))
+    cmds.textFieldGrp('suffixTextField', label="Suffix:", text=_ui_state["suffix"],
+                      textChangedCommand=_stored("suffix"))
     cmds.rowColumnLayout(numberOfColumns=2, columnWidth=[(1, 180), (2, 180)])
     cmds.button(label="Add Prefix", command=lambda x: rename_with_prefix_suffix(1))
     cmds.button(label="Add Suffix", command=lambda x: rename_with_prefix_suffix(2))
@@ -37,7 +99,7 @@ def clementdaures_rename_tool():
     cmds.separator(height=20, style="in")
 
     # Remove Characters Section
-    cmds.frameLayout(label="Remove Characters", collapsable=True, width=380, marginHeight=5)
+    cmds.frameLayout(label="Remove Characters")
     cmds.rowColumnLayout(numberOfColumns=2, columnWidth=[(1, 180), (2, 180)])
     cmds.button(label="Remove First Character", command=lambda x: remove_character(1))
     cmds.button(label="Remove Last Character", command=lambda x: remove_character(2))
@@ -46,132 +108,271 @@ def clementdaures_rename_tool():
     cmds.separator(height=20, style="in")
 
     # Quick Prefix Section
-    cmds.frameLayout(label="Quick Prefix", collapsable=True, width=380, marginHeight=5)
+    cmds.frameLayout(label="Quick Prefix")
     cmds.rowColumnLayout(numberOfColumns=5, columnWidth=[(1, 75), (2, 75), (3, 75), (4, 75), (5, 75)])
-    quick_prefix_buttons = ['Grp', 'Sk', 'Jnt','Bn', 'Ctrl', 'EFF', 'IKRP', 'IKSC', 'IKSPL', 'IKSPR', 'Loc', 'Geo', 'Proxy', 'Wire', 'ffdLat', 'RBN', 'CRV', 'BS', 'DRV', 'AUTO']
-    for prefix in quick_prefix_buttons:
-        cmds.button(label=prefix, command=lambda x, p=prefix: add_quick_prefix(p))
+    for prefix in QUICK_PREFIXES:
+        cmds.button(label=prefix, command=_QUICK_PREFIX_CBS[prefix])
     cmds.setParent('..')
 
     cmds.separator(height=20, style="in")
 
     # Quick Suffix Section
-    cmds.frameLayout(label="Quick Suffix", collapsable=True, width=380, marginHeight=5)
+    cmds.frameLayout(label="Quick Suffix")
     cmds.rowColumnLayout(numberOfColumns=5, columnWidth=[(1, 75), (2, 75), (3, 75), (4, 75), (5, 75)])
-    quick_suffix_buttons = ['Lt', 'Rt', 'T', 'TOP', 'MID', 'LOW', 'CTR']
-    for suffix in quick_suffix_buttons:
-        cmds.button(label=suffix, command=lambda x, s=suffix: add_quick_suffix(s))
+    for suffix in QUICK_SUFFIXES:
+        cmds.button(label=suffix, command=_QUICK_SUFFIX_CBS[suffix])
     cmds.setParent('..')
 
     cmds.separator(height=20, style="in")
 
     # Search and Replace Section
-    cmds.frameLayout(label="Search and Replace", collapsable=True, width=380, marginHeight=5)
-    cmds.textFieldGrp('searchTextField', label="Search:", columnAlign=(1, 'right'), columnWidth=[(1, 80), (2, 280)])
-    cmds.textFieldGrp('replaceTextField', label="Replace:", columnAlign=(1, 'right'), columnWidth=[(1, 80), (2, 280)])
-    cmds.radioButtonGrp('searchReplaceOption', numberOfRadioButtons=3, label="Scope:", labelArray3=["Hierarchy", "Selected", "All"], select=2)
+    cmds.frameLayout(label="Search and Replace")
+    cmds.textFieldGrp('searchTextField', label="Search:", text=_ui_state["search"],
+                      textChangedCommand=_stored("search"))
+    cmds.textFieldGrp('replaceTextField', label="Replace:", text=_ui_state["replace"],
+                      textChangedCommand=_stored("replace"))
+    cmds.radioButtonGrp('searchReplaceOption', numberOfRadioButtons=3, label="Scope:", labelArray3=["Hierarchy", "Selected", "All"], select=_ui_state["scope"],
+                        changeCommand=_tracked("scope"))
     cmds.button(label="Apply Search and Replace", height=30, command=lambda x: search_and_replace())
 
     # Open Advanced Features Window Button
     cmds.separator(height=20, style="in")
     cmds.button(label="Advanced Features", height=40, command=lambda x: open_advanced_features_window())
 
+    cmds.setUITemplate(popTemplate=True)
     cmds.showWindow(window)
 
+def _stored(key):
+    """Build a change callback that stores the value Maya passes in as _ui_state[key]."""
+    def callback(value, *_):
+        _ui_state[key] = value
+    return callback
+
+def _tracked(key):
+    """Build a change callback that queries the control for its value, for controls that do not pass the value itself."""
+    def callback(*_):
+        _query_field(key)
+    return callback
+
+def _query_field(key):
+    """Copy the current value of the control behind key into _ui_state and return it, the stored value is kept when the control is gone."""
+    control_command, control, flag = _UI_CONTROLS[key]
+    if control_command(control, exists=True):
+        _ui_state[key] = control_command(control, query=True, **{flag: True})
+    return _ui_state[key]
+
+def _push_ui_state():
+    """Write _ui_state into every existing control, so a reused window shows what the operations will use."""
+    # Re-running the script resets _ui_state while a hidden window keeps its old entries
+    for key, (control_command, control, flag) in _UI_CONTROLS.items():
+        if control_command(control, exists=True):
+            control_command(control, edit=True, **{flag: _ui_state[key]})
+
+def _dispatch(kind, argument, *_):
+    """Shared quick button callback, runs the quick operation for kind and drops the arguments Maya passes."""
+    {'prefix': add_quick_prefix, 'suffix': add_quick_suffix}[kind](argument)
+
+# Quick button callbacks, built once at import rather than on every window build
+_QUICK_PREFIX_CBS = {prefix: partial(_dispatch, 'prefix', prefix) for prefix in QUICK_PREFIXES}
+_QUICK_SUFFIX_CBS = {suffix: partial(_dispatch, 'suffix', suffix) for suffix in QUICK_SUFFIXES}
+
 # Renaming Core Functions
 
+def _require_selection():
+    """Return the current selection as long names, warning when nothing is selected."""
+    selected_objects = cmds.ls(selection=True, long=True)
+    if not selected_objects:
+        cmds.warning("Please select at least one object.")
+    return selected_objects
+
+def _get_short_name(full_path):
+    """Strip the DAG path from a long object name."""
+    return full_path.rpartition('|')[2]
+
+def _node_path(handle):
+    """Return the current long name of a tracked node, following any rename of it or its parents."""
+    node = handle.object()
+    if node.hasFn(om.MFn.kDagNode):
+        return om.MFnDagNode(node).fullPathName()
+    return om.MFnDependencyNode(node).name()
+
+def _record(old_name, new_name):
+    """Append one rename to both history columns."""
+    renaming_history_old.append(old_name)
+    renaming_history_new.append(new_name)
+
+def _batch_rename(pairs):
+    """Rename each (object, new name) pair inside one undo chunk and record it in the history."""
+    # Nothing to rename, do not leave an empty chunk in the undo queue
+    if not pairs:
+        return
+    # Resolve every object to a handle first, Maya keeps its identity across renames of its parents
+    queued = [(om.MObjectHandle(om.MSelectionList().add(obj).getDependNode(0)), obj, new_name) for obj, new_name in pairs]
+    new_names = {new_name for _, new_name in pairs}
+    with _undo_chunk():
+        # Objects of the batch still holding another object's new name move to a temporary name first,
+        # so no rename below clashes with a name the batch is about to give up
+        for handle, obj, new_name in queued:
+            current_path = _node_path(handle)
+            short_name = _get_short_name(current_path)
+            if short_name != new_name and short_name in new_names:
+                cmds.rename(current_path, 'dcRenameTmp#')
+        for handle, obj, new_name in queued:
+            renamed_object = cmds.rename(_node_path(handle), new_name)
+            _record(obj, renamed_object)
+
+def _rename_with(objects, transform):
+    """Rename each object to transform(short name), skipping the names it leaves empty or unchanged."""
+    pairs = []
+    for obj in objects:
+        short_name = _get_short_name(obj)
+        new_name = transform(short_name)
+        if new_name and new_name != short_name:
+            pairs.append((obj, new_name))
+    _batch_rename(pairs)
+
+def _number_names(objects, base_names, start_number, padding):
+    """Pair each object with its base name followed by the next free padded number, counting up from start_number."""
+    # Skip numbers already used by objects outside the selection so Maya never has to resolve a clash,
+    # names held inside the selection are freed by _batch_rename
+    selected_set = set(objects)
+    patterns = [f"{base_name}*" for base_name in set(base_names)]
+    taken_names = {_get_short_name(obj) for obj in cmds.ls(patterns, long=True) or [] if obj not in selected_set}
+
+    # Build the padded name format once instead of converting and zero-filling a string per object
+    name_format = ("{}{:0%dd}" % max(padding, 1)).format
+    pairs = []
+    number = start_number
+    for obj, base_name in zip(objects, base_names):
+        numbered_name = name_format(base_name, number)
+        while numbered_name in taken_names:
+            number += 1
+            numbered_name = name_format(base_name, number)
+        taken_names.add(numbered_name)
+        pairs.append((obj, numbered_name))
+        number += 1
+    return pairs
+
 def rename_and_number_objects():
     """Rename selected objects with numbering and padding."""
-    selected_objects = cmds.ls(selection=True)
-    new_name = cmds.textFieldGrp('renameTextField', query=True, text=True)
-    start_number = cmds.intFieldGrp('startNumberField', query=True, value1=True)
-    padding = cmds.intFieldGrp('paddingField', query=True, value1=True)
+    selected_objects = _require_selection()
+    if not selected_objects:
+        return
+    new_name = _ui_state["base_name"]
+    # The int fields only report a value once it is committed, read what they show right now
+    start_number = _query_field("start_number")
+    padding = _query_field("padding")
     
     if not new_name:
         cmds.warning("Please enter a new name.")
         return
 
-    for i, obj in enumerate(selected_objects):
-        numbered_name = f"{new_name}{str(start_number + i).zfill(padding)}"
-        renamed_object = cmds.rename(obj, numbered_name)
-        renaming_history.append((obj, renamed_object))
+    _batch_rename(_number_names(selected_objects, [new_name] * len(selected_objects), start_number, padding))
 
 def rename_with_prefix_suffix(mode):
     """Add prefix or suffix to selected objects."""
-    selected_objects = cmds.ls(selection=True)
+    selected_objects = _require_selection()
+    if not selected_objects:
+        return
     if mode == 1:  # Prefix mode
-        prefix = cmds.textFieldGrp('prefixTextField', query=True, text=True)
+        prefix = _ui_state["prefix"]
         if not prefix:
             cmds.warning("Please enter a prefix.")
             return
-        for obj in selected_objects:
-            renamed_object = cmds.rename(obj, prefix + obj.split('|')[-1])
-            renaming_history.append((obj, renamed_object))
+        _rename_with(selected_objects, lambda short_name: prefix + short_name)
     elif mode == 2:  # Suffix mode
-        suffix = cmds.textFieldGrp('suffixTextField', query=True, text=True)
+        suffix = _ui_state["suffix"]
         if not suffix:
             cmds.warning("Please enter a suffix.")
             return
-        for obj in selected_objects:
-            renamed_object = cmds.rename(obj, obj.split('|')[-1] + suffix)
-            renaming_history.append((obj, renamed_object))
+        _rename_with(selected_objects, lambda short_name: short_name + suffix)
 
 def remove_character(position):
     """Remove the first or last character from selected objects."""
-    selected_objects = cmds.ls(selection=True)
-    for obj in selected_objects:
-        short_name = obj.split('|')[-1]
-        if position == 1 and len(short_name) > 1:  # Remove first character
-            renamed_object = cmds.rename(obj, short_name[1:])
-        elif position == 2 and len(short_name) > 1:  # Remove last character
-            renamed_object = cmds.rename(obj, short_name[:-1])
-        renaming_history.append((obj, renamed_object))
+    # Single character names come back empty and are left alone
+    if position == 1:  # Remove first character
+        _rename_with(_require_selection(), lambda short_name: short_name[1:])
+    elif position == 2:  # Remove last character
+        _rename_with(_require_selection(), lambda short_name: short_name[:-1])
 
 def add_quick_prefix(prefix):
     """Add a predefined quick prefix to selected objects."""
-    selected_objects = cmds.ls(selection=True)
-    for obj in selected_objects:
-        renamed_object = cmds.rename(obj, prefix + '_' + obj.split('|')[-1])
-        renaming_history.append((obj, renamed_object))
+    _rename_with(_require_selection(), lambda short_name: prefix + '_' + short_name)
 
 def add_quick_suffix(suffix):
     """Add a predefined quick suffix to selected objects."""
-    selected_objects = cmds.ls(selection=True)
-    for obj in selected_objects:
-        renamed_object = cmds.rename(obj, obj.split('|')[-1] + '_' + suffix)
-        renaming_history.append((obj, renamed_object))
+    _rename_with(_require_selection(), lambda short_name: short_name + '_' + suffix)
+
+def compose_rename(prefix="", suffix="", number=False, start=1, padding=2, search=None, replace=None):
+    """Apply search and replace, prefix, suffix and numbering to the selection in one undo step, with number=True one counter runs across all base names so a skipped number shifts every later one."""
+    selected_objects = _require_selection()
+    if not selected_objects:
+        return
+    short_names = [_get_short_name(obj) for obj in selected_objects]
+    new_names = [prefix + (short_name.replace(search, replace or "") if search else short_name) + suffix
+                 for short_name in short_names]
+    if number:
+        # Same collision-free numbering as the Rename and Number button
+        new_names = [numbered_name for _, numbered_name in _number_names(selected_objects, new_names, start, padding)]
+    pairs = [(obj, new_name) for obj, short_name, new_name in zip(selected_objects, short_names, new_names)
+             if new_name and new_name != short_name]
+    _batch_rename(pairs)
 
 def search_and_replace():
     """Search for a term in selected object names and replace it."""
-    search_term = cmds.textFieldGrp('searchTextField', query=True, text=True)
-    replace_term = cmds.textFieldGrp('replaceTextField', query=True, text=True)
-    option = cmds.radioButtonGrp('searchReplaceOption', query=True, select=True)
+    search_term = _ui_state["search"]
+    replace_term = _ui_state["replace"]
+    option = _ui_state["scope"]
     
     if not search_term:
         cmds.warning("Please enter a search term.")
         return
+    if search_term == replace_term:
+        cmds.warning("Search and replace terms are identical.")
+        return
 
-    if option == 1:
-        objs = cmds.ls(selection=True, dag=True, long=True)
-    elif option == 2:
-        objs = cmds.ls(selection=True, long=True)
-    elif option == 3:
-        objs = cmds.ls(long=True)
-
+    if option == 3:
+        # Let Maya match the name pattern instead of listing every node in the scene, shapes are left out,
+        # so a shape whose name is not derived from its transform's (e.g. pCubeShape1 under L_arm_geo) is not reached
+        objs = cmds.ls(f"*{search_term}*", long=True, recursive=True, excludeType="shape") or []
+    else:
+        selected_objects = _require_selection()
+        if not selected_objects:
+            return
+        if option == 1:
+            # Selected objects plus their descendant transforms, descendant shapes are left out
+            descendants = cmds.listRelatives(selected_objects, allDescendents=True, fullPath=True, type="transform") or []
+            objs = list(dict.fromkeys(selected_objects + descendants))
+        else:
+            objs = selected_objects
+
+    # A name only changes when it contains the search term, so no separate containment test is needed
+    pairs = []
     for obj in objs:
-        short_name = obj.split('|')[-1]
+        short_name = _get_short_name(obj)
         new_name = short_name.replace(search_term, replace_term)
-        renamed_object = cmds.rename(obj, new_name)
-        renaming_history.append((obj, renamed_object))
+        if new_name != short_name:
+            pairs.append((obj, new_name))
+    if not pairs:
+        if option == 2:
+            cmds.warning(f"No object names contain '{search_term}'.")
+        else:
+            cmds.warning(f"No renamable (non-shape) object names contain '{search_term}'.")
+        return
+    _batch_rename(pairs)
 
 # Advanced Features Window
 
 def open_advanced_features_window():
     """Opens a new window with advanced renaming features like history and naming conventions."""
+    # Reuse the hidden window when it is still around, resetting its menu and history to the current state
     if cmds.window('dc_advancedWindow', exists=True):
-        cmds.deleteUI('dc_advancedWindow')
+        _push_ui_state()
+        refresh_history_list()
+        cmds.showWindow('dc_advancedWindow')
+        return
 
-    window = cmds.window('dc_advancedWindow', title="Advanced Features", widthHeight=(400, 400), sizeable=True)
+    window = cmds.window('dc_advancedWindow', title="Advanced Features", widthHeight=(400, 400), sizeable=True, retain=True)
     cmds.columnLayout(adjustableColumn=True, rowSpacing=10)
 
     # Renaming History Section
@@ -184,41 +385,39 @@ def open_advanced_features_window():
 
     # Automated Naming Conventions
     cmds.frameLayout(label="Automated Naming Conventions", collapsable=True, width=380)
-    cmds.optionMenuGrp('namingConventionMenu', label="Convention:", columnAlign=(1, 'right'))
-    cmds.menuItem(label="Rig")
-    cmds.menuItem(label="Animation")
-    cmds.menuItem(label="Geometry")
-    cmds.menuItem(label="Controller")
+    cmds.optionMenuGrp('namingConventionMenu', label="Convention:", columnAlign=(1, 'right'),
+                       changeCommand=_stored("convention"))
+    for convention in _CONVENTION_PREFIX:
+        cmds.menuItem(label=convention)
+    cmds.optionMenuGrp('namingConventionMenu', edit=True, value=_ui_state["convention"])
     cmds.button(label="Apply Convention", command=lambda x: apply_naming_convention())
 
+    refresh_history_list()
     cmds.showWindow(window)
 
 def refresh_history_list():
     """Refresh the renaming history in the advanced features window."""
+    lines = [f"{old_name} --> {new_name}" for old_name, new_name in zip(renaming_history_old, renaming_history_new)]
     cmds.textScrollList('historyTextScroll', edit=True, removeAll=True)
-    for old_name, new_name in renaming_history:
-        cmds.textScrollList('historyTextScroll', edit=True, append=f"{old_name} --> {new_name}")
+    if lines:
+        cmds.textScrollList('historyTextScroll', edit=True, append=lines)
 
 def clear_history():
     """Clears the renaming history."""
-    global renaming_history
-    renaming_history.clear()
+    renaming_history_old.clear()
+    renaming_history_new.clear()
     refresh_history_list()
 
 def apply_naming_convention():
     """Apply a naming convention based on the selected option."""
-    convention = cmds.optionMenuGrp('namingConventionMenu', query=True, value=True)
-    selected_objects = cmds.ls(selection=True)
-    for obj in selected_objects:
-        if convention == "Rig":
-            renamed_object = cmds.rename(obj, f"RIG_{obj}")
-        elif convention == "Animation":
-            renamed_object = cmds.rename(obj, f"ANIM_{obj}")
-        elif convention == "Geometry":
-            renamed_object = cmds.rename(obj, f"GEO_{obj}")
-        elif convention == "Controller":
-            renamed_object = cmds.rename(obj, f"CTRL_{obj}")
-        renaming_history.append((obj, renamed_object))
-
-# Launch the tool
-clementdaures_rename_tool()
+    convention = _ui_state["convention"]
+    prefix = _CONVENTION_PREFIX[convention]
+    _rename_with(_require_selection(), lambda short_name: prefix + short_name)
+
+def main():
+    """Entry point for shelf buttons and userSetup.py, opens the Rename Tool window."""
+    clementdaures_rename_tool()
+
+# Launch the tool when the script is executed directly (e.g. from the Script Editor)
+if __name__ == '__main__':
+    main()
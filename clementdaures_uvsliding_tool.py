@@ -1,5 +1,6 @@
 
 from maya import cmds
+from maya.api import OpenMaya as om
 import re
 
 # Function to create the UI
@@ -30,9 +31,9 @@ def show_ui():
     
     cmds.separator(height=10, style="in")
     
-    # Checkbox for U or V coordinate selection
+    # Radio buttons for U or V coordinate selection, only one can be active at a time
     cmds.text(label="Coordinate to Drive:")
-    u_or_v = cmds.checkBoxGrp("coordinate_selection", numberOfCheckBoxes=2, labelArray2=["Use U Coordinate", "Use V Coordinate"], value1=True, value2=False)
+    u_or_v = cmds.radioButtonGrp("coordinate_selection", numberOfRadioButtons=2, labelArray2=["Use U Coordinate", "Use V Coordinate"], select=1)
     
     cmds.separator(height=10, style="in")
     
@@ -80,6 +81,12 @@ def select_controller(controller_field):
 def run_script_on_joints(controller_field, attr_name_field, uvpin_field, u_or_v):
     global selected_controller
     
+    # Query the joint selection once, before anything is added to the controller
+    jnt_selection = cmds.ls(selection=True)
+    if not jnt_selection:
+        cmds.warning("No joints selected. Please select joints and try again.")
+        return
+    
     # Get the controller name from the text field if entered
     controller_name = cmds.textField(controller_field, query=True, text=True).strip()
     if controller_name:
@@ -96,11 +103,6 @@ def run_script_on_joints(controller_field, attr_name_field, uvpin_field, u_or_v)
         cmds.warning("Please specify an attribute name to drive the UV pin.")
         return
     
-    # Ensure the custom attribute exists
-    if not cmds.attributeQuery(attr_name, node=selected_controller, exists=True):
-        cmds.addAttr(selected_controller, longName=attr_name, attributeType='double', keyable=True)
-        cmds.setAttr(f"{selected_controller}.{attr_name}", 0)  # Initialize it with 0
-    
     # Get the UV pin name
     uv_pin = cmds.textField(uvpin_field, query=True, text=True).strip()
     if not uv_pin or not cmds.objExists(uv_pin):
@@ -108,43 +110,55 @@ def run_script_on_joints(controller_field, attr_name_field, uvpin_field, u_or_v)
         return
     
     # Determine whether to use U or V coordinate
-    use_u = cmds.checkBoxGrp(u_or_v, query=True, value1=True)
-    use_v = cmds.checkBoxGrp(u_or_v, query=True, value2=True)
-    if use_u == use_v:
-        cmds.warning("Please select either U or V coordinate, but not both.")
-        return
-    
+    use_u = cmds.radioButtonGrp(u_or_v, query=True, select=True) == 1
     coordinate = "coordinateU" if use_u else "coordinateV"
 
-    # Select joints
-    jnt_selection = cmds.ls(selection=True)
-    if not jnt_selection:
-        cmds.warning("No joints selected. Please select joints and try again.")
-        return
+    # Read the U or V value of every joint's coordinate in one pass over the UV pin
+    uv_pin_fn = om.MFnDependencyNode(om.MSelectionList().add(uv_pin).getDependNode(0))
+    coordinate_plug = uv_pin_fn.findPlug('coordinate', False)
+    coordinate_attr = uv_pin_fn.attribute(coordinate)
+    uv_values = [coordinate_plug.elementByLogicalIndex(i).child(coordinate_attr).asDouble() for i in range(len(jnt_selection))]
 
-    # Process each selected joint
-    for i, joint in enumerate(jnt_selection):
-        # Retrieve the U or V value for the corresponding joint
-        uv_value = cmds.getAttr(f'{uv_pin}.coordinate[{i}].{coordinate}')
+    # Driver plug shared by every joint's network
+    controller_plug = f'{selected_controller}.{attr_name}'
+
+    # Create the driver attribute and every joint's network inside one undo chunk so the whole run undoes in a single step
+    cmds.undoInfo(openChunk=True, chunkName='uvSliding')
+    try:
+        # Ensure the custom attribute exists
+        if not cmds.attributeQuery(attr_name, node=selected_controller, exists=True):
+            cmds.addAttr(selected_controller, longName=attr_name, attributeType='double', keyable=True)
+            cmds.setAttr(controller_plug, 0)  # Initialize it with 0
+        
+        # Process each selected joint
+        for i, joint in enumerate(jnt_selection):
+            uv_value = uv_values[i]
         
-        # Create addDoubleLinear and modulo nodes
-        add_name = f'{joint}_Add'
-        modulo_name = f'{joint}_Modulo'
-        add_node = cmds.createNode('addDoubleLinear', n=add_name)
-        modulo_node = cmds.createNode('modulo', n=modulo_name)
+            # Create addDoubleLinear and modulo nodes
+            add_name = f'{joint}_Add'
+            modulo_name = f'{joint}_Modulo'
+            add_node = cmds.createNode('addDoubleLinear', n=add_name)
+            modulo_node = cmds.createNode('modulo', n=modulo_name)
         
-        # Set the initial input1 value for addDoubleLinear
-        cmds.setAttr(f'{add_node}.input1', uv_value)
-        cmds.setAttr(f'{modulo_node}.modulus', 1)
+            # Set the initial input1 value for addDoubleLinear
+            cmds.setAttr(f'{add_node}.input1', uv_value)
+            cmds.setAttr(f'{modulo_node}.modulus', 1)
         
-        # Connect the custom attribute to addDoubleLinear's input2
-        cmds.connectAttr(f'{selected_controller}.{attr_name}', f'{add_node}.input2')
-        cmds.connectAttr(f'{add_node}.output', f'{modulo_node}.input')
+            # Connect the custom attribute to addDoubleLinear's input2
+            cmds.connectAttr(controller_plug, f'{add_node}.input2')
+            cmds.connectAttr(f'{add_node}.output', f'{modulo_node}.input')
         
-        # Connect modulo's output to the UV pin's coordinate attribute
-        cmds.connectAttr(f'{modulo_node}.output', f'{uv_pin}.coordinate[{i}].{coordinate}')
+            # Connect modulo's output to the UV pin's coordinate attribute
+            cmds.connectAttr(f'{modulo_node}.output', f'{uv_pin}.coordinate[{i}].{coordinate}')
+    finally:
+        cmds.undoInfo(closeChunk=True)
 
     cmds.confirmDialog(title="Script Complete", message="Script executed successfully on selected joints.")
 
-# Launch the UI
-show_ui()
+# Entry point for shelf buttons and userSetup.py
+def main():
+    show_ui()
+
+# Launch the UI when the script is executed directly (e.g. from the Script Editor)
+if __name__ == '__main__':
+    main()